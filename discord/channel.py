@@ -1597,6 +1597,8 @@ class PartialMessageable(discord.abc.Messageable, Hashable):
         The channel type associated with this partial messageable, if given.
     """
 
+    __slots__ = ('_state', '_channel', 'id', 'type')
+
     def __init__(self, state: 'ConnectionState', id: int, type: Optional[ChannelType] = None):
         self._state: ConnectionState = state
         self._channel: Object = Object(id=id)
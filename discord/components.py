@@ -362,11 +362,11 @@ class SelectMenu:
                 'The maximum length of a the placeholder is 100 characters; your one is %s long (%s to long).' % (
                 len(placeholder), len(placeholder) - 100))
         self.placeholder = placeholder
-        if 25 < min_values < 0:
-            raise ValueError('The minimum number of elements to be selected must be between 1 and 25.')
+        if not 0 <= min_values <= 25:
+            raise ValueError('The minimum number of elements to be selected must be between 0 and 25.')
         self.min_values = min_values
-        if 25 < max_values <= 0:
-            raise ValueError('The maximum number of elements to be selected must be between 0 and 25.')
+        if not 1 <= max_values <= 25:
+            raise ValueError('The maximum number of elements to be selected must be between 1 and 25.')
         self.max_values = max_values
         self.disabled = disabled
         self._values = None
@@ -504,6 +504,9 @@ class SelectMenu:
                    max_values=data.pop('max_values', 1))
 
 
+_action_row_component_types = {2: Button, 3: SelectMenu}
+
+
 class ActionRow:
     """
     Represents an ActionRow-Part for the components of an :class:`discord.Message`.
@@ -528,8 +531,7 @@ class ActionRow:
                 if not component.get('type', None) in [2, 3]:
                     raise InvalidArgument(
                         'If you use an Dict instead of Button or SelectMenu you have to pass an type between 2 or 3')
-                self.components.append(
-                    {2: Button.from_dict(component), 3: SelectMenu.from_dict(component)}.get(component.get('type')))
+                self.components.append(_action_row_component_types[component['type']].from_dict(component))
 
     def __repr__(self):
         return f'<ActionRow components={self.components}>'
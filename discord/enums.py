@@ -24,8 +24,9 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
+import sys
 import types
-from collections import namedtuple
+import functools
 
 __all__ = (
     'Enum',
@@ -62,11 +63,39 @@ __all__ = (
 )
 
 
+_missing = object()
+
+
 def _create_value_cls(name):
-    cls = namedtuple('_EnumValue_' + name, 'name value')
-    cls.__repr__ = lambda self: '<%s.%s: %r>' % (name, self.name, self.value)
-    cls.__str__ = lambda self: '%s.%s' % (name, self.name)
-    return cls
+    enum_name = name
+
+    class _EnumValue:
+        __slots__ = ('name', 'value')
+
+        def __init__(self, name, value):
+            object.__setattr__(self, 'name', name)
+            object.__setattr__(self, 'value', value)
+
+        def __repr__(self):
+            return '<%s.%s: %r>' % (enum_name, self.name, self.value)
+
+        def __str__(self):
+            return '%s.%s' % (enum_name, self.name)
+
+        def __setattr__(self, name, value):
+            raise TypeError('Enums are immutable.')
+
+        def __delattr__(self, name):
+            raise TypeError('Enums are immutable.')
+
+        def __copy__(self):
+            return self
+
+        def __deepcopy__(self, memo):
+            return self
+
+    _EnumValue.__name__ = _EnumValue.__qualname__ = '_EnumValue_' + name
+    return _EnumValue
 
 
 def _is_descriptor(obj):
@@ -76,8 +105,9 @@ def _is_descriptor(obj):
 class EnumMeta(type):
     def __new__(cls, name, bases, attrs):
         value_mapping = {}
-        member_mapping = {}
         member_names = []
+        members = []
+        aliases = {}
 
         value_cls = _create_value_cls(name)
         for key, value in list(attrs.items()):
@@ -94,19 +124,27 @@ class EnumMeta(type):
                 del attrs[key]
                 continue
 
-            try:
-                new_value = value_mapping[value]
-            except KeyError:
-                new_value = value_cls(name=key, value=value)
-                value_mapping[value] = new_value
+            if isinstance(value, str):
+                value = sys.intern(value)
+
+            members.append((key, value))
+
+        for key, value in members:
+            if value not in value_mapping:
+                value_mapping[value] = value_cls(name=key, value=value)
                 member_names.append(key)
+                aliases[value] = (key,)
+            else:
+                aliases[value] += (key,)
 
-            member_mapping[key] = new_value
-            attrs[key] = new_value
+        member_mapping = {key: value_mapping[value] for key, value in members}
+        attrs.update(member_mapping)
 
         attrs['_enum_value_map_'] = value_mapping
         attrs['_enum_member_map_'] = member_mapping
+        attrs['_enum_members_proxy_'] = types.MappingProxyType(member_mapping)
         attrs['_enum_member_names_'] = member_names
+        attrs['_enum_aliases_'] = aliases
         actual_cls = super().__new__(cls, name, bases, attrs)
         value_cls._actual_enum_cls_ = actual_cls
         return actual_cls
@@ -125,13 +163,16 @@ class EnumMeta(type):
 
     @property
     def __members__(cls):
-        return types.MappingProxyType(cls._enum_member_map_)
+        return cls._enum_members_proxy_
 
     def __call__(cls, value):
         try:
-            return cls._enum_value_map_[value]
-        except (KeyError, TypeError):
+            member = cls._enum_value_map_.get(value, _missing)
+        except TypeError:
+            member = _missing
+        if member is _missing:
             raise ValueError("%r is not a valid %s" % (value, cls.__name__))
+        return member
 
     def __getitem__(cls, key):
         return cls._enum_member_map_[key]
@@ -145,20 +186,19 @@ class EnumMeta(type):
     def __instancecheck__(self, instance):
         # isinstance(x, Y)
         # -> __instancecheck__(Y, x)
-        try:
-            return instance._actual_enum_cls_ is self
-        except AttributeError:
-            return False
+        return getattr(instance, '_actual_enum_cls_', None) is self
 
 
 class Enum(metaclass=EnumMeta):
     @classmethod
     def try_value(cls, value):
         try:
-            return cls._enum_value_map_[value]
-        except (KeyError, TypeError):
+            return cls._enum_value_map_.get(value, value)
+        except TypeError:
             return value
 
+    from_value = try_value
+
 
 class ChannelType(Enum):
     text           = 0
@@ -181,12 +221,11 @@ class PermissionType(Enum):
     member = 0
     role   = 1
 
-    # i use :meth:`getattr` so `codacy` don't cry and *my own* code is as clean as possible.
     def __str__(self):
-        return getattr(self, 'name')
+        return self.name
 
     def __int__(self):
-        return getattr(self, 'value')
+        return self.value
 
 
 class ComponentType(Enum):
@@ -195,13 +234,16 @@ class ComponentType(Enum):
     SelectMenu = 3
 
     def __str__(self):
-        return getattr(self, 'name')
+        return self.name
 
     def __int__(self):
-        return getattr(self, 'value')
+        return self.value
 
     def __eq__(self, other):
-        return int(self) == other or str(self) == other
+        return self is other or self.value == other or self.name == other
+
+    def __hash__(self):
+        return hash(self.value)
 
 
 class ButtonStyle(Enum):
@@ -228,26 +270,15 @@ class ButtonStyle(Enum):
     grey_url    = 5
     Link_Button = 5
 
-    @classmethod
-    def from_value(cls, value):
-        return try_enum(cls, value)
-
-    # the same as in the class above.
     def __str__(self):
-        return getattr(self, 'name')
+        return self.name
 
     def __int__(self):
-        return getattr(self, 'value')
+        return self.value
 
 
-class ButtonColor(ButtonStyle):
-    """
-    :class:`ButtonColor`
+ButtonColor = ButtonStyle
 
-    .. note ::
-        This is just an Aliase to :class:`ButtonStyle`.
-    """
-    pass
 
 class InteractionCallbackType(Enum):
     pong = 1
@@ -256,16 +287,11 @@ class InteractionCallbackType(Enum):
     deferred_update_msg = 6
     update_msg = 7
 
-    @classmethod
-    def from_value(cls, value):
-        return try_enum(cls, value)
-
-    # the same as in the class above.
     def __str__(self):
-        return getattr(self, 'name')
+        return self.name
 
     def __int__(self):
-        return getattr(self, 'value')
+        return self.value
 
 
 class TimestampStyle(Enum):
@@ -285,15 +311,10 @@ class TimestampStyle(Enum):
 
     def __repr__(self):
         """Represents the :class:`TimestampStyle`."""
-        return getattr(self, 'name')
+        return self.name
 
     def __str__(self):
-        return getattr(self, 'value')
-
-
-    @classmethod
-    def from_value(cls, value):
-        return try_enum(cls, value)
+        return self.value
 
 
 class MessageType(Enum):
@@ -475,68 +496,67 @@ class AuditLogAction(Enum):
 
     @property
     def category(self):
-        lookup = {
-            AuditLogAction.guild_update:        AuditLogActionCategory.update,
-            AuditLogAction.channel_create:      AuditLogActionCategory.create,
-            AuditLogAction.channel_update:      AuditLogActionCategory.update,
-            AuditLogAction.channel_delete:      AuditLogActionCategory.delete,
-            AuditLogAction.overwrite_create:    AuditLogActionCategory.create,
-            AuditLogAction.overwrite_update:    AuditLogActionCategory.update,
-            AuditLogAction.overwrite_delete:    AuditLogActionCategory.delete,
-            AuditLogAction.kick:                None,
-            AuditLogAction.member_prune:        None,
-            AuditLogAction.ban:                 None,
-            AuditLogAction.unban:               None,
-            AuditLogAction.member_update:       AuditLogActionCategory.update,
-            AuditLogAction.member_role_update:  AuditLogActionCategory.update,
-            AuditLogAction.member_move:         None,
-            AuditLogAction.member_disconnect:   None,
-            AuditLogAction.bot_add:             None,
-            AuditLogAction.role_create:         AuditLogActionCategory.create,
-            AuditLogAction.role_update:         AuditLogActionCategory.update,
-            AuditLogAction.role_delete:         AuditLogActionCategory.delete,
-            AuditLogAction.invite_create:       AuditLogActionCategory.create,
-            AuditLogAction.invite_update:       AuditLogActionCategory.update,
-            AuditLogAction.invite_delete:       AuditLogActionCategory.delete,
-            AuditLogAction.webhook_create:      AuditLogActionCategory.create,
-            AuditLogAction.webhook_update:      AuditLogActionCategory.update,
-            AuditLogAction.webhook_delete:      AuditLogActionCategory.delete,
-            AuditLogAction.emoji_create:        AuditLogActionCategory.create,
-            AuditLogAction.emoji_update:        AuditLogActionCategory.update,
-            AuditLogAction.emoji_delete:        AuditLogActionCategory.delete,
-            AuditLogAction.message_delete:      AuditLogActionCategory.delete,
-            AuditLogAction.message_bulk_delete: AuditLogActionCategory.delete,
-            AuditLogAction.message_pin:         None,
-            AuditLogAction.message_unpin:       None,
-            AuditLogAction.integration_create:  AuditLogActionCategory.create,
-            AuditLogAction.integration_update:  AuditLogActionCategory.update,
-            AuditLogAction.integration_delete:  AuditLogActionCategory.delete,
-        }
-        return lookup[self]
+        return _AUDIT_LOG_ACTION_CATEGORIES[self]
 
     @property
     def target_type(self):
         v = self.value
         if v == -1:
             return 'all'
-        elif v < 10:
-            return 'guild'
-        elif v < 20:
-            return 'channel'
-        elif v < 30:
-            return 'user'
-        elif v < 40:
-            return 'role'
-        elif v < 50:
-            return 'invite'
-        elif v < 60:
-            return 'webhook'
-        elif v < 70:
-            return 'emoji'
-        elif v < 80:
-            return 'message'
-        elif v < 90:
-            return 'integration'
+        try:
+            return _AUDIT_LOG_ACTION_TARGET_TYPES[v // 10]
+        except IndexError:
+            return None
+
+_AUDIT_LOG_ACTION_TARGET_TYPES = (
+    'guild',        # 0-9
+    'channel',      # 10-19
+    'user',         # 20-29
+    'role',         # 30-39
+    'invite',       # 40-49
+    'webhook',      # 50-59
+    'emoji',        # 60-69
+    'message',      # 70-79
+    'integration',  # 80-89
+)
+
+_AUDIT_LOG_ACTION_CATEGORIES = {
+    AuditLogAction.guild_update:        AuditLogActionCategory.update,
+    AuditLogAction.channel_create:      AuditLogActionCategory.create,
+    AuditLogAction.channel_update:      AuditLogActionCategory.update,
+    AuditLogAction.channel_delete:      AuditLogActionCategory.delete,
+    AuditLogAction.overwrite_create:    AuditLogActionCategory.create,
+    AuditLogAction.overwrite_update:    AuditLogActionCategory.update,
+    AuditLogAction.overwrite_delete:    AuditLogActionCategory.delete,
+    AuditLogAction.kick:                None,
+    AuditLogAction.member_prune:        None,
+    AuditLogAction.ban:                 None,
+    AuditLogAction.unban:               None,
+    AuditLogAction.member_update:       AuditLogActionCategory.update,
+    AuditLogAction.member_role_update:  AuditLogActionCategory.update,
+    AuditLogAction.member_move:         None,
+    AuditLogAction.member_disconnect:   None,
+    AuditLogAction.bot_add:             None,
+    AuditLogAction.role_create:         AuditLogActionCategory.create,
+    AuditLogAction.role_update:         AuditLogActionCategory.update,
+    AuditLogAction.role_delete:         AuditLogActionCategory.delete,
+    AuditLogAction.invite_create:       AuditLogActionCategory.create,
+    AuditLogAction.invite_update:       AuditLogActionCategory.update,
+    AuditLogAction.invite_delete:       AuditLogActionCategory.delete,
+    AuditLogAction.webhook_create:      AuditLogActionCategory.create,
+    AuditLogAction.webhook_update:      AuditLogActionCategory.update,
+    AuditLogAction.webhook_delete:      AuditLogActionCategory.delete,
+    AuditLogAction.emoji_create:        AuditLogActionCategory.create,
+    AuditLogAction.emoji_update:        AuditLogActionCategory.update,
+    AuditLogAction.emoji_delete:        AuditLogActionCategory.delete,
+    AuditLogAction.message_delete:      AuditLogActionCategory.delete,
+    AuditLogAction.message_bulk_delete: AuditLogActionCategory.delete,
+    AuditLogAction.message_pin:         None,
+    AuditLogAction.message_unpin:       None,
+    AuditLogAction.integration_create:  AuditLogActionCategory.create,
+    AuditLogAction.integration_update:  AuditLogActionCategory.update,
+    AuditLogAction.integration_delete:  AuditLogActionCategory.delete,
+}
 
 class UserFlags(Enum):
     staff = 1
@@ -556,6 +576,14 @@ class UserFlags(Enum):
     verified_bot = 65536
     verified_bot_developer = 131072
 
+    @classmethod
+    def decompose(cls, value):
+        """Returns a tuple of the :class:`UserFlags` set in the ``value`` bitmask.
+
+        Bits that do not belong to a known flag are ignored.
+        """
+        return _decompose_flags(cls, value)
+
 class ActivityType(Enum):
     unknown = -1
     playing = 0
@@ -596,14 +624,25 @@ class StickerType(Enum):
     apng = 2
     lottie = 3
 
+@functools.lru_cache(maxsize=128)
+def _decompose_flags(cls, value):
+    value_map = cls._enum_value_map_
+    flags = []
+    while value > 0:
+        bit = value & -value
+        flag = value_map.get(bit)
+        if flag is not None:
+            flags.append(flag)
+        value ^= bit
+    return tuple(flags)
+
 def try_enum(cls, val):
     """A function that tries to turn the value into enum ``cls``.
 
     If it fails it returns the value instead.
     """
 
-    # i use :meth:`getattr` so `codacy` don't cry and *my own* code is as clean as possible.
     try:
-        return getattr(cls, '_enum_value_map_')[val]
-    except (KeyError, TypeError, AttributeError):
+        return cls._enum_value_map_.get(val, val)
+    except (TypeError, AttributeError):
         return val
@@ -376,7 +376,7 @@ class PublicUserFlags(BaseFlags):
 
     def all(self):
         """List[:class:`UserFlags`]: Returns all public flags the user has."""
-        return [public_flag for public_flag in UserFlags if self._has_flag(public_flag.value)]
+        return list(UserFlags.decompose(self.value))
 
 
 @fill_with_flags()
@@ -36,7 +36,7 @@ from .reaction import Reaction
 from .emoji import Emoji
 from .partial_emoji import PartialEmoji
 from .calls import CallMessage
-from .enums import MessageType, ChannelType, try_enum
+from .enums import MessageType, ChannelType
 from .errors import InvalidArgument, ClientException, HTTPException, NotFound
 from .embeds import Embed
 from .components import Button, SelectMenu, ActionRow
@@ -56,6 +56,9 @@ __all__ = (
     'DeletedReferencedMessage',
 )
 
+# MessageType is resolved for every received message, so skip the try_enum call.
+_message_types = MessageType._enum_value_map_
+
 
 def convert_emoji_reaction(emoji):
     if isinstance(emoji, Reaction):
@@ -564,7 +567,8 @@ class Message(Hashable):
         self.channel = channel
         self.call = None
         self._edited_timestamp = utils.parse_time(data['edited_timestamp'])
-        self.type = try_enum(MessageType, data['type'])
+        message_type = data['type']
+        self.type = _message_types.get(message_type, message_type)
         self.pinned = data['pinned']
         self.flags = MessageFlags._from_value(data.get('flags', 0))
         self.mention_everyone = data['mention_everyone']
@@ -702,7 +706,7 @@ class Message(Hashable):
         self.tts = value
 
     def _handle_type(self, value):
-        self.type = try_enum(MessageType, value)
+        self.type = _message_types.get(value, value)
 
     def _handle_content(self, value):
         self.content = value
@@ -42,6 +42,12 @@ import warnings
 
 from .errors import InvalidArgument
 
+try:
+    from ciso8601 import parse_datetime_as_naive as _parse_datetime
+    has_ciso8601 = True
+except ImportError:
+    has_ciso8601 = False
+
 DISCORD_EPOCH = 1420070400000
 MAX_ASYNCIO_SECONDS = 3456000
 
@@ -115,7 +121,8 @@ class SequenceProxy(collections.abc.Sequence):
 
 def parse_time(timestamp):
     if timestamp:
-
+        if has_ciso8601:
+            return _parse_datetime(timestamp)
         return datetime.datetime(*map(int, re.split(r'[^\d]', timestamp.replace('+00:00', ''))))
     return None
 
@@ -51,6 +51,7 @@ readme = Path('./README.rst').read_text(encoding='utf-8')
 #
 extras_require = {
     'voice': ['PyNaCl>=1.3.0,<1.5'],
+    'speed': ['ciso8601'],
     'docs': [
         'sphinx==3.0.3',
         'sphinxcontrib_trio==1.1.2',